@@ -1,415 +1,667 @@
 #!/usr/bin/env python3
+"""
+Employee HR Management System (with CSV export)
+- admin passwords hashed with Argon2id, scrypt or PBKDF2 (best available)
+- switch DB file with set_db_file(path) or CLI --db argument
+- input validation for names, departments, positions and salaries
+- CSV export from the menu, or non-interactively with --export [FILE | -]
+"""
 from __future__ import annotations
 
 import argparse
+import atexit
+import contextlib
 import csv
 import getpass
 import hashlib
+import importlib
+import importlib.util
+import io
+import json
 import os
-import re
 import secrets
 import sqlite3
 import sys
+import threading
+import time
 from datetime import datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional, Sequence, Tuple
+from typing import BinaryIO, Callable, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+# Optional: google-re2 matches in linear time; the validator patterns behave the same under either engine
+try:
+    import re2 as _re
 
-from colorama import Fore, Style, init
-from tabulate import tabulate
+    _RE_FLAGS = ()  # RE2 takes no flags and has no Unicode-table overhead
+except ImportError:  # pragma: no cover - optional dependency
+    import re as _re
 
-# Initialize colorama
-init(autoreset=True)
+    _RE_FLAGS = (_re.ASCII,)
+
+# Optional: argon2-cffi provides the preferred (memory-hard) admin password KDF.
+# Only its presence is checked here; _derive_key imports it when a hash is needed.
+_HAVE_ARGON2 = importlib.util.find_spec("argon2") is not None
 
 # ---------------------------
-# Configuration / defaults
+# Terminal output helpers
 # ---------------------------
-DB_FILE = "Employees.db"
-"""
-Employee HR Management System (with CSV export)
-- Uses PBKDF2 for admin passwords
-- switch DB file with set_db_file(path) or CLI --db argument
-- robust input validation using strip() and isdigit()
-- CSV export added
+# colorama and tabulate are imported on first use so one-shot CLI runs stay fast
+_colorama = None
+_tabulate = None
+
+# Escape codes looked up once when colorama loads: Fore codes by name, Style.BRIGHT
+_FORE: Dict[str, str] = {}
+_BRIGHT = ""
+
+
+def _lazy_color():
+    """Import colorama (and enable autoreset) on first use."""
+    global _colorama, _BRIGHT
+    if _colorama is None:
+        _colorama = importlib.import_module("colorama")
+        _colorama.init(autoreset=True)
+        for name in ("RED", "GREEN", "YELLOW", "BLUE", "LIGHTBLUE_EX", "CYAN", "MAGENTA"):
+            _FORE[name] = getattr(_colorama.Fore, name)
+        _BRIGHT = _colorama.Style.BRIGHT
+    return _colorama
+
+
+def _lazy_tabulate():
+    """Import tabulate.tabulate on first use."""
+    global _tabulate
+    if _tabulate is None:
+        _tabulate = importlib.import_module("tabulate").tabulate
+    return _tabulate
+
+
+def tabulate(*args, **kwargs) -> str:
+    """Proxy to tabulate.tabulate, importing it on first call."""
+    return _lazy_tabulate()(*args, **kwargs)
 
-import sqlite3
-import re
-import sys
-import os
-import getpass
-import hashlib
-import secrets
-from tabulate import tabulate
-from colorama import Fore, Style, init
-import argparse
-import csv
-from datetime import datetime
-from pathlib import Path
 
-init(autoreset=True)
+# Above this many rows view_all renders with _fast_grid instead of tabulate
+FAST_GRID_THRESHOLD = 500
+
+
+def _plain_text(v: str) -> bool:
+    """True if tabulate would print v left-aligned and unchanged (no padding, not number-like)."""
+    if not v or not v.isascii() or not v.isprintable() or v != v.strip():
+        return False
+    try:
+        float(v.replace(",", ""))
+    except ValueError:
+        return True
+    return False
+
+
+def _fast_grid(rows: Sequence[Sequence], headers: Sequence[str]) -> Optional[str]:
+    """Render rows like tabulate(..., tablefmt="grid") for large result sets.
+
+    Column widths are measured up front, then every row goes through a
+    single prebuilt str.format template. Only columns that are all ints
+    (right-aligned) or all plain text (left-aligned) are handled; for
+    anything else tabulate's own rules apply, so None is returned and the
+    caller should use tabulate.
+    """
+    aligns = []
+    for col in zip(*rows):
+        if all(type(v) is int for v in col):
+            aligns.append(">")
+        elif all(type(v) is str and _plain_text(v) for v in col):
+            aligns.append("<")
+        else:
+            return None
+    widths = [max(len(h) + 2, max(len(str(row[i])) for row in rows)) for i, h in enumerate(headers)]
+    sep = "+" + "+".join("-" * (w + 2) for w in widths) + "+"
+    fmt = "| " + " | ".join(f"{{:{a}{w}}}" for a, w in zip(aligns, widths)) + " |"
+    body = f"\n{sep}\n".join(fmt.format(*row) for row in rows)
+    return "\n".join((sep, fmt.format(*headers), sep.replace("-", "="), body, sep))
 
+
+def _paint(color: str, s: str, bright: bool) -> str:
+    if _colorama is None:
+        _lazy_color()
+    if bright:
+        return _FORE[color] + _BRIGHT + s
+    return _FORE[color] + s
+
+
+class C:
+    """Colour facade over colorama, e.g. C.red("Invalid ID.")."""
+
+    @staticmethod
+    def red(s: str, bright: bool = False) -> str:
+        return _paint("RED", s, bright)
+
+    @staticmethod
+    def green(s: str, bright: bool = False) -> str:
+        return _paint("GREEN", s, bright)
+
+    @staticmethod
+    def yellow(s: str, bright: bool = False) -> str:
+        return _paint("YELLOW", s, bright)
+
+    @staticmethod
+    def blue(s: str, bright: bool = False) -> str:
+        return _paint("BLUE", s, bright)
+
+    @staticmethod
+    def lightblue(s: str, bright: bool = False) -> str:
+        return _paint("LIGHTBLUE_EX", s, bright)
+
+    @staticmethod
+    def cyan(s: str, bright: bool = False) -> str:
+        return _paint("CYAN", s, bright)
+
+    @staticmethod
+    def magenta(s: str, bright: bool = False) -> str:
+        return _paint("MAGENTA", s, bright)
+
+
+def _say(msg: str) -> None:
+    """Write one status line to stdout in a single write() call."""
+    sys.stdout.write(msg + "\n")
+
+
+# ---------------------------
+# Configuration / defaults
+# ---------------------------
 # Default DB file (can be changed via set_db_file or CLI)
 DB_FILE = "Employees.db"
-"""
+
 # PBKDF2 settings
 HASH_NAME = "sha256"
 ITERATIONS = 150_000
 SALT_BYTES = 16
 KEY_LEN = 32
 
-NAME_RE = re.compile(r"^[A-Za-z .'\-]{2,70}$")
-DEPT_RE = re.compile(r"^[A-Za-z0-9 &\-\_]{1,40}$")
-POSITION_RE = re.compile(r"^[A-Za-z0-9 .,&'\-\/]{1,60}$")
+# scrypt settings (used when hashlib provides it)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+# Argon2id settings (used when argon2-cffi is installed)
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 65536  # KiB
+ARGON2_PARALLELISM = 1
+
+# KDF for new passwords: argon2id > scrypt > pbkdf2
+if _HAVE_ARGON2:
+    DEFAULT_SCHEME = "argon2id"
+elif hasattr(hashlib, "scrypt"):
+    DEFAULT_SCHEME = "scrypt"
+else:
+    DEFAULT_SCHEME = "pbkdf2"
+
+# ASCII-only patterns; anchoring comes from fullmatch (stricter than "$", and valid in RE2)
+NAME_RE = _re.compile(r"[A-Za-z .'\-]{2,70}", *_RE_FLAGS)
+DEPT_RE = _re.compile(r"[A-Za-z0-9 &\-\_]{1,40}", *_RE_FLAGS)
+POSITION_RE = _re.compile(r"[A-Za-z0-9 .,&'\-\/]{1,60}", *_RE_FLAGS)
+# bound match methods used by the validators
+NAME_MATCH = NAME_RE.fullmatch
+DEPT_MATCH = DEPT_RE.fullmatch
+POSITION_MATCH = POSITION_RE.fullmatch
 
 
 # ---------------------------
 # Database helpers
 # ---------------------------
-def set_db_file(path: str) -> None:
-    """Set the global DB file path for the running process."""
+# Connection cache: one sqlite3 connection per thread, opened once and reused
+_tls = threading.local()
+
+# DB paths whose parent directory has already been checked/created
+_db_dirs_verified: Set[str] = set()
+
+# Applied once when a connection is opened (per-connection settings)
+_CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-65536;
+PRAGMA mmap_size=268435456;
+"""
 
-# ---------------------------
-# DB connection helpers
-# ---------------------------
-def set_db_file(path: str):
+
+def set_db_file(path: str) -> None:
     """Set the global DB file path at runtime (for demos, tests, per-customer files)."""
-    global DB_FILE
+    global DB_FILE, _admin_exists_cache
+    if path != DB_FILE:
+        close_connection()
+        _admin_exists_cache = None
     DB_FILE = path
 
 
 def get_connection(db_file: Optional[str] = None) -> sqlite3.Connection:
-    """Return a sqlite3 connection for the configured DB file."""
+    """Return the cached sqlite3 connection for the configured DB file.
+
+    The connection is opened once per thread in autocommit mode and reused by
+    every query. Do not close it directly; use close_connection().
+    """
     path = db_file or DB_FILE
-    if path != ":memory:":
-        # ensure directory exists
+    conn = getattr(_tls, "conn", None)
+    if conn is not None and _tls.path == path:
+        return conn
+    close_connection()
+    if path != ":memory:" and path not in _db_dirs_verified:
+        # ensure directory exists (checked once per path per process)
         dirpath = os.path.dirname(os.path.abspath(path))
         if dirpath and not os.path.exists(dirpath):
             os.makedirs(dirpath, exist_ok=True)
-def get_connection(db_file: str = None):
-    Return a sqlite3.Connection to DB_FILE or to db_file if provided.
-    Use this everywhere to allow easy switching.
-    path = db_file or DB_FILE
-    # ensure directory exists for file-based DB
-    if path != ":memory:":
-        dirpath = os.path.dirname(os.path.abspath(path))
-        if dirpath and not os.path.exists(dirpath):
-            try:
-                os.makedirs(dirpath, exist_ok=True)
-            except Exception:
-                pass
-    conn = sqlite3.connect(path, timeout=10)
+        _db_dirs_verified.add(path)
+    conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)
+    conn.executescript(_CONNECTION_PRAGMAS)
+    _tls.conn = conn
+    _tls.path = path
     return conn
 
 
-def execute_query(query: str, params: Sequence = (), fetch: bool = False, fetchone: bool = False, commit: bool = False):
-   """ Execute a SQL statement with safe parameterization.
+def close_connection() -> None:
+    """Close this thread's cached connection, if one is open."""
+    conn = getattr(_tls, "conn", None)
+    if conn is not None:
+        _tls.conn = None
+        conn.close()
+
+
+atexit.register(close_connection)
+
+# Rows pulled per fetchmany() call when streaming large result sets
+FETCH_CHUNK = 1000
+
+
+def execute_query(
+    query: str,
+    params: Sequence = (),
+    fetch: bool = False,
+    fetchone: bool = False,
+    commit: bool = False,
+):
+    """Execute a SQL statement with safe parameterization.
+
+    Runs on the cached connection; with commit=True the statement is wrapped
+    in an explicit BEGIN/COMMIT.
     Returns:
       - None on error
       - list of rows if fetch=True
       - single row if fetchone=True
       - [] if no rows
-   """
-def execute_query(query, params=(), fetch=False, fetchone=False, commit=False):
-   """" Helper to run queries safely. Returns:
-      - None on error,
-      - list of tuples if fetch=True,
-      - single tuple if fetchone=True,
-      - [] for no rows.
     """
+    conn = None
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(query, params)
-            result = None
-            if fetchone:
-                result = cur.fetchone()
-            elif fetch:
-                result = cur.fetchall()
-            if commit:
-                conn.commit()
-            cur.close()
-            return result
+        conn = get_connection()
+        if commit:
+            conn.execute("BEGIN")
+        cur = conn.execute(query, params)
+        result = None
+        if fetchone:
+            result = cur.fetchone()
+        elif fetch:
+            result = cur.fetchall()
+        if commit:
+            conn.execute("COMMIT")
+        return result
+    except Exception as exc:  # pragma: no cover - runtime error reporting
+        if conn is not None and conn.in_transaction:
+            conn.execute("ROLLBACK")
+        print (C.red(f"[DB ERROR] {exc}"))
+        return None
+
+
+def execute_query_iter(query: str, params: Sequence = ()) -> Optional[sqlite3.Cursor]:
+    """Execute a read-only SELECT and return the live cursor (None on error).
+
+    Nothing is fetched here; callers drain the cursor with fetchmany() or plain
+    iteration, FETCH_CHUNK rows per step, so large results never sit in memory.
+    Rows are always plain tuples, whatever row_factory the connection has.
+    """
+    try:
+        cur = get_connection().cursor()
+        cur.row_factory = None
+        cur.arraysize = FETCH_CHUNK
+        return cur.execute(query, params)
     except Exception as exc:  # pragma: no cover - runtime error reporting
-        print (Fore.RED + f"[DB ERROR] {exc}")
-    except Exception as e:
-        print (Fore.RED + f"[DB ERROR] {e}")
+        print (C.red(f"[DB ERROR] {exc}"))
         return None
 
 
 # ---------------------------
 # Password hashing helpers
 # ---------------------------
-def hash_password(password: str, salt: Optional[bytes] = None) -> Tuple[str, str]:
-    """Return tuple (salt_hex, key_hex)."""
-def hash_password(password: str, salt: bytes = None):
+def _derive_key(password: str, salt: bytes, scheme: str, dklen: int) -> bytes:
+    """Run the KDF named by scheme ("argon2id", "scrypt" or "pbkdf2")."""
+    if scheme == "argon2id":
+        try:
+            from argon2.low_level import Type, hash_secret_raw
+        except ImportError as exc:
+            raise RuntimeError("argon2-cffi is required to verify this password") from exc
+        return hash_secret_raw(
+            password.encode("utf-8"),
+            salt,
+            time_cost=ARGON2_TIME_COST,
+            memory_cost=ARGON2_MEMORY_COST,
+            parallelism=ARGON2_PARALLELISM,
+            hash_len=dklen,
+            type=Type.ID,
+        )
+    if scheme == "scrypt":
+        return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P, dklen=dklen)
+    return hashlib.pbkdf2_hmac(HASH_NAME, password.encode("utf-8"), salt, ITERATIONS, dklen=dklen)
+
+
+def hash_password(password: str, salt: Optional[bytes] = None, scheme: str = DEFAULT_SCHEME) -> Tuple[str, str, str]:
+    """Return tuple (salt_hex, key_hex, scheme)."""
     if salt is None:
         salt = secrets.token_bytes(SALT_BYTES)
-    key = hashlib.pbkdf2_hmac(HASH_NAME, password.encode("utf-8"), salt, ITERATIONS, dklen=KEY_LEN)
-    return salt.hex(), key.hex()
+    key = _derive_key(password, salt, scheme, KEY_LEN)
+    return salt.hex(), key.hex(), scheme
+
+
+# Session-only cache of recent successful verifications: (key_hex, probe) -> monotonic time.
+# Lives in process memory only, so it is gone when the process exits.
+_verify_cache: Dict[Tuple[str, bytes], float] = {}
+VERIFY_CACHE_TTL = 60.0
+
 
+def verify_password(password: str, salt_hex: str, key_hex: str, scheme: str = "pbkdf2") -> bool:
+    """Check password against the stored hash.
 
-def verify_password(password: str, salt_hex: str, key_hex: str) -> bool:
-def verify_password(password: str, salt_hex: str, key_hex: str):
+    A success is remembered for VERIFY_CACHE_TTL seconds so repeat logins in
+    the same session skip the KDF; failures always run the full KDF.
+    """
     salt = bytes.fromhex(salt_hex)
+    probe = hashlib.blake2b(password.encode("utf-8") + salt, digest_size=16).digest()
+    cache_key = (key_hex, probe)
+    now = time.monotonic()
+    seen = _verify_cache.get(cache_key)
+    if seen is not None and now - seen < VERIFY_CACHE_TTL:
+        return True
     expected = bytes.fromhex(key_hex)
-    key = hashlib.pbkdf2_hmac(HASH_NAME, password.encode("utf-8"), salt, ITERATIONS, dklen=len(expected))
-    return secrets.compare_digest(key, expected)
+    key = _derive_key(password, salt, scheme, len(expected))
+    if secrets.compare_digest(key, expected):
+        _verify_cache[cache_key] = now
+        return True
+    return False
+
+
+def warn_slow_crypto_backend() -> None:
+    """Warn when PBKDF2 is in use on an OpenSSL too old for SHA-NI acceleration."""
+    if DEFAULT_SCHEME != "pbkdf2":
+        return
+    try:
+        import ssl
+    except ImportError:  # pragma: no cover - Python built without ssl
+        return
+    if ssl.OPENSSL_VERSION_INFO < (1, 1, 1):
+        print (C.yellow(f"Warning: Python is linked against {ssl.OPENSSL_VERSION}; admin logins will be slow."))
+        print (C.yellow("Rebuild Python against OpenSSL >= 1.1.1 (SHA extensions) for faster password hashing."))
 
 
 # ---------------------------
 # Validation helpers
 # ---------------------------
-# Input validation helpers
-# ---------------------------
-NAME_RE = re.compile(r"^[A-Za-z .'\-]{2,70}$")
-DEPT_RE = re.compile(r"^[A-Za-z0-9 &\-\_]{1,40}$")
-POSITION_RE = re.compile(r"^[A-Za-z0-9 .,&'\-\/]{1,60}$")
-
-
 def validate_name(name: str) -> bool:
-    return bool(NAME_RE.match(name.strip()))
+    return NAME_MATCH(name.strip()) is not None
 
 
 def validate_department(dept: str) -> bool:
-    return bool(DEPT_RE.match(dept.strip()))
+    return DEPT_MATCH(dept.strip()) is not None
 
 
 def validate_position(pos: str) -> bool:
-    return bool(POSITION_RE.match(pos.strip()))
+    return POSITION_MATCH(pos.strip()) is not None
+
+
+def validate_employee_fields(name: str, dept: str, pos: str) -> Tuple[bool, Optional[str]]:
+    """Validate name, department and position in one call.
+
+    Returns (True, None), or (False, message) for the first invalid field.
+    """
+    if NAME_MATCH(name.strip()) is None:
+        return False, "Invalid name. Use letters and common punctuation (2-70 chars)."
+    if DEPT_MATCH(dept.strip()) is None:
+        return False, "Invalid department name."
+    if POSITION_MATCH(pos.strip()) is None:
+        return False, "Invalid position."
+    return True, None
+
+
+# str.translate table that deletes thousands separators
+_COMMA_STRIP = str.maketrans("", "", ",")
+
 
 def parse_int(s: Optional[str]) -> Tuple[bool, Optional[int]]:
-    """Parse integer with optional comma separators. Reject negatives."""
-def parse_int(s: str):
     """
     Strip and parse an integer. Accepts comma separators (e.g. "50,000").
-    Uses isdigit() after sanitizing. Rejects negative numbers.
+    Only ASCII digits are accepted, so negatives are rejected.
     Returns (ok: bool, value: int | None)
     """
     if s is None:
         return False, None
-    s2 = s.strip().replace(",", "")
-    if s2.isdigit():
-        val = int(s2)
-        if val < 0:
-            return False, None
-        return True, val
+    s2 = s.strip().translate(_COMMA_STRIP)
+    if s2.isascii() and s2.isdigit():
+        return True, int(s2)
     return False, None
 
 
 # ---------------------------
 # Initialization and seed
 # ---------------------------
-def init_db() -> None:
-    """Create required tables if they do not exist."""
-# Database initialization
-# ---------------------------
-def init_db():
-    with get_connection() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            """
-        CREATE TABLE IF NOT EXISTS Employees (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            department TEXT NOT NULL,
-            position TEXT NOT NULL,
-            salary INTEGER NOT NULL,
-            UNIQUE(name, department)
-        );
-        """
-        )
-        cur.execute(
-            """
-        CREATE TABLE IF NOT EXISTS Admins (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            salt TEXT NOT NULL,
-            passhash TEXT NOT NULL
-        );
-        """
-        )
-        conn.commit()
-        cur.close()
+# Tables and indexes, run as one script inside the bootstrap transaction
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS Employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    department TEXT NOT NULL,
+    position TEXT NOT NULL,
+    salary INTEGER NOT NULL,
+    UNIQUE(name, department)
+);
+-- department lookups and per-department aggregates (covering), salary range filters
+CREATE INDEX IF NOT EXISTS idx_emp_dept_sal ON Employees(department, salary);
+CREATE INDEX IF NOT EXISTS idx_emp_salary ON Employees(salary);
+CREATE TABLE IF NOT EXISTS Admins (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    salt TEXT NOT NULL,
+    passhash TEXT NOT NULL,
+    scheme TEXT NOT NULL DEFAULT 'pbkdf2'
+);
+"""
 
+_INSERT_EMPLOYEE_SQL = "INSERT OR IGNORE INTO Employees (name, department, position, salary) VALUES (?, ?, ?, ?);"
 
-def seed_default_data() -> None:
-    """Seed sample data if Employees is empty (safe for demos)."""
-def seed_default_data():
-    # only seed if table empty
-    res = execute_query("SELECT COUNT(*) FROM Employees;", fetchone=True)
-    if res is None:
-        return
-    count = res[0]
-    if count == 0:
-        employees = [
-            ("Albert Einstein", "IT", "Manager", 55000)
-            ("Segio Abar", "Finance", "Manager", 50000)
-            ("Paul Skywalker", "IT", "Developer", 35000)
-            ("John Smith", "IT", "Director", 80000)
-            ("Michael Sheen", "Health", "Administrator", 20000)
-            ("Muhammed Ashar", "IT", "Data Analyst", 40000)
-            ("Malcom Mayer", "Health", "Data Analyst", 40000)
-            ("Bumpy Jay", "Finance", "Accountant", 80000)
-            ("Ryan Booth", "Finance", "Director", 50000)
-            ("James Reece", "IT", "PS", 90000)
-        ]
-        try:
-            with get_connection() as conn:
-                cur = conn.cursor()
-                cur.executemany(
-                    "INSERT OR IGNORE INTO Employees (name, department, position, salary) VALUES (?, ?, ?, ?);",
-                    employees,
-                )
-                conn.commit()
-                cur.close()
-                print (Fore.GREEN + "Default Employee Data Added Successfully!")
-        except Exception as exc:  # pragma: no cover
-            print (Fore.RED + f"[Seed Error] {exc}")
-    else:
-        print (Fore.BLUE + "Employee Data Already Exists, skipping insert...")
+# Keep the lowest id per (name, department); each row is checked with one probe
+# of the UNIQUE(name, department) index instead of grouping the whole table
+_DEDUP_SQL = """
+DELETE FROM Employees AS e
+WHERE EXISTS (
+    SELECT 1 FROM Employees AS d
+    WHERE d.name = e.name AND d.department = e.department AND d.id < e.id
+);
+"""
 
+# Demo rows seeded into an empty Employees table
+DEFAULT_EMPLOYEES = [
+    ("Albert Einstein", "IT", "Manager", 55000),
+    ("Segio Abar", "Finance", "Manager", 50000),
+    ("Paul Skywalker", "IT", "Developer", 35000),
+    ("John Smith", "IT", "Director", 80000),
+    ("Michael Sheen", "Health", "Administrator", 20000),
+    ("Muhammed Ashar", "IT", "Data Analyst", 40000),
+    ("Malcom Mayer", "Health", "Data Analyst", 40000),
+    ("Bumpy Jay", "Finance", "Accountant", 80000),
+    ("Ryan Booth", "Finance", "Director", 50000),
+    ("James Reece", "IT", "PS", 90000),
+]
+
+
+def _init_step(conn: sqlite3.Connection, step, label: str):
+    """Run one optional bootstrap step under a savepoint and return its result.
+
+    On failure only that step is undone; the error is reported as
+    "[<label> Error]" and None is returned, so the rest of init_db still commits.
+    """
+    conn.execute("SAVEPOINT init_step")
+    try:
+        result = step()
+    except Exception as exc:  # pragma: no cover - runtime error reporting
+        conn.execute("ROLLBACK TO init_step")
+        conn.execute("RELEASE init_step")
+        print (C.red(f"[{label} Error] {exc}"))
+        return None
+    conn.execute("RELEASE init_step")
+    return result
 
-def remove_duplicates() -> None:
-    """Remove duplicate employee rows (keep lowest id)."""
-                print (Fore.GREEN + "Default Employee Data Added Successfully!")
-        except Exception as e:
-            print (Fore.RED + f"[Seed Error] {e}")
-    else:
-        print (Fore.BLUE + "Employee Data Already Exists, skipping insert...")
 
+def init_db(seed: bool = False) -> None:
+    """Bootstrap the database in a single transaction.
 
-def remove_duplicates():
+    Creates tables and indexes, migrates old Admins tables, seeds
+    DEFAULT_EMPLOYEES into an empty table when seed=True and removes duplicate
+    employees -- one BEGIN/COMMIT (and one fsync) for the whole startup.
+    """
+    conn = get_connection()
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                """
-            DELETE FROM Employees
-            WHERE id NOT IN (
-                SELECT MIN(id)
-                FROM Employees
-                GROUP BY name, department
-            );
-            """
-            )
-            conn.commit()
-            cur.close()
-        print (Fore.GREEN + "✅ Duplicate records removed.")
-    except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Cleanup Error] {exc}")
+        # executescript() commits any open transaction first, so BEGIN goes inside the script
+        conn.executescript("BEGIN IMMEDIATE;" + _SCHEMA_SQL)
+        # older databases predate the scheme column; their hashes are PBKDF2
+        cols = [r[1] for r in conn.execute("PRAGMA table_info(Admins);")]
+        if "scheme" not in cols:
+            conn.execute("ALTER TABLE Admins ADD COLUMN scheme TEXT NOT NULL DEFAULT 'pbkdf2';")
+        seeded = _init_step(conn, seed_default_data, "Seed") if seed else None
+        removed = _init_step(conn, remove_duplicates, "Cleanup")
+        conn.execute("COMMIT")
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    if seeded:
+        print (C.green("Default Employee Data Added Successfully!"))
+    elif seeded is not None:
+        print (C.blue("Employee Data Already Exists, skipping insert..."))
+    if removed:
+        print (C.green(f"✅ {removed} duplicate records removed."))
+
+
+# Rows per executemany() call when bulk-inserting employees
+BULK_CHUNK = 10_000
+
+
+def bulk_insert_employees(rows: Iterable[Tuple[str, str, str, int]]) -> int:
+    """Insert (name, department, position, salary) rows in a single transaction.
+
+    Rows are fed to executemany() in BULK_CHUNK slices; existing
+    (name, department) pairs are ignored. Returns the number of rows inserted.
+    If a transaction is already open (as in init_db) the rows join it instead.
+    Prefer this over looping add-style inserts for imports and seeding.
+    """
+    conn = get_connection()
+    before = conn.total_changes
+    it = iter(rows)
+    own_tx = not conn.in_transaction
+    if own_tx:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        while True:
+            chunk = list(islice(it, BULK_CHUNK))
+            if not chunk:
+                break
+            conn.executemany(_INSERT_EMPLOYEE_SQL, chunk)
+        if own_tx:
+            conn.execute("COMMIT")
+    except Exception:
+        if own_tx:
+            conn.execute("ROLLBACK")
+        raise
+    return conn.total_changes - before
+
+
+def seed_default_data() -> bool:
+    """Seed DEFAULT_EMPLOYEES if Employees is empty; return True if rows were added."""
+    if get_connection().execute("SELECT 1 FROM Employees LIMIT 1;").fetchone() is not None:
+        return False
+    bulk_insert_employees(DEFAULT_EMPLOYEES)
+    return True
+
+
+def remove_duplicates() -> int:
+    """Remove duplicate employee rows (keep lowest id); return how many were deleted."""
+    return get_connection().execute(_DEDUP_SQL).rowcount
 
 
 # ---------------------------
 # Admin helpers
 # ---------------------------
-def admin_exists() -> bool:
-        print (Fore.GREEN + "✅ Duplicate records removed.")
-    except Exception as e:
-        print (Fore.RED + f"[Cleanup Error] {e}")
+# Cached admin_exists() answer; reset by set_db_file(), set once an admin is saved
+_admin_exists_cache: Optional[bool] = None
 
 
-# ---------------------------
-# Admin functions
-# ---------------------------
-def admin_exists():
-    r = execute_query("SELECT COUNT(*) FROM Admins;", fetchone=True)
-    return bool(r and r[0] > 0)
+def admin_exists() -> bool:
+    """Return True if at least one admin account exists (cached per DB file)."""
+    global _admin_exists_cache
+    if _admin_exists_cache is None:
+        _admin_exists_cache = execute_query("SELECT 1 FROM Admins LIMIT 1;", fetchone=True) is not None
+    return _admin_exists_cache
 
 
 def set_admin_password_interactive() -> None:
     """Interactive admin password creation/upsert."""
-    print (Fore.CYAN + "=== Set Admin Password ===")
-def set_admin_password_interactive():
-    print (Fore.CYAN + "=== Set Admin Password ===")
+    global _admin_exists_cache
+    print (C.cyan("=== Set Admin Password ==="))
     username = input("Admin username (default 'admin'): ").strip() or "admin"
     while True:
         pw = getpass.getpass("Enter new password: ")
         pw2 = getpass.getpass("Confirm password: ")
         if pw != pw2:
-            print (Fore.RED + "Passwords do not match — try again.")
+            print (C.red("Passwords do not match — try again."))
             continue
         if len(pw) < 6:
-            print (Fore.RED + "Password too short — minimum 6 characters.")
+            print (C.red("Password too short — minimum 6 characters."))
             continue
-        salt_hex, key_hex = hash_password(pw)
+        salt_hex, key_hex, scheme = hash_password(pw)
         try:
-            execute_query(
+            # upsert using ON CONFLICT; errors propagate to the handler below
+            # (execute_query would swallow them), and RETURNING confirms the write
+            saved = get_connection().execute(
                 """
-            INSERT INTO Admins (username, salt, passhash)
-            VALUES (?, ?, ?)
+            INSERT INTO Admins (username, salt, passhash, scheme)
+            VALUES (?, ?, ?, ?)
             ON CONFLICT(username)
-            DO UPDATE SET salt=excluded.salt, passhash=excluded.passhash;
+            DO UPDATE SET salt=excluded.salt, passhash=excluded.passhash, scheme=excluded.scheme
+            RETURNING id;
             """,
-                (username, salt_hex, key_hex),
-                commit=True,
-            )
-            print (Fore.GREEN + "Admin password set.")
+                (username, salt_hex, key_hex, scheme),
+            ).fetchone()
+            if saved is None:
+                print (C.red("[Admin Save Error] admin row was not written"))
+                break
+            _admin_exists_cache = True
+            print (C.green("Admin password set."))
             break
         except Exception as exc:  # pragma: no cover
-            print (Fore.RED + f"[Admin Save Error] {exc}")
+            print (C.red(f"[Admin Save Error] {exc}"))
             break
 
 
 def login() -> bool:
     """Prompt for login and verify credentials."""
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Admin Login ===")
+    print (C.cyan("\n=== Admin Login ===", bright=True))
     username = input("Admin username: ").strip()
     pw = getpass.getpass("Password: ")
     try:
-        row = execute_query("SELECT salt, passhash FROM Admins WHERE username=?;", (username,), fetchone=True)
+        row = execute_query("SELECT salt, passhash, scheme FROM Admins WHERE username=?;", (username,), fetchone=True)
         if not row:
-            print (Fore.RED + "Unknown admin username.")
+            print (C.red("Unknown admin username."))
             return False
-        salt_hex, key_hex = row
-        if verify_password(pw, salt_hex, key_hex):
-            print (Fore.GREEN + "\n--- Welcome back Admin! ---")
+        salt_hex, key_hex, scheme = row
+        if verify_password(pw, salt_hex, key_hex, scheme):
+            print (C.green("\n--- Welcome back Admin! ---"))
             return True
-        print (Fore.RED + "\n⚠️ Wrong Credentials!")
+        print (C.red("\n⚠️ Wrong Credentials!"))
         return False
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Login Error] {exc}")
-            print (Fore.RED + "Passwords do not match — try again.")
-            continue
-        if len(pw) < 6:
-            print (Fore.RED + "Password too short — minimum 6 characters.")
-            continue
-        salt_hex, key_hex = hash_password(pw)
-        try:
-            # upsert using ON CONFLICT
-            execute_query(
-                          """
-                          INSERT INTO Admins (username, salt, passhash)
-                          VALUES (?, ?, ?)
-                          ON CONFLICT(username)
-                          DO UPDATE SET salt=excluded.salt, passhash=excluded.passhash;
-                          """,
-                          (username, salt_hex, key_hex), commit=True)
-
-            print (Fore.GREEN + "Admin password set.")
-            break
-        except Exception as e:
-            print (Fore.RED + f"[Admin Save Error] {e}")
-            break
-
-
-def login():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Admin Login ===")
-    username = input("Admin username: ").strip()
-    pw = getpass.getpass("Password: ")
-
-    try:
-        row = execute_query("SELECT salt, passhash FROM Admins WHERE username=?;", (username,), fetchone=True)
-        if not row:
-            print (Fore.RED + "Unknown admin username.")
-            return False
-        salt_hex, key_hex = row
-        if verify_password(pw, salt_hex, key_hex):
-            print (Fore.GREEN + "\n--- Welcome back Admin! ---")
-            return True
-        else:
-            print (Fore.RED + "\n⚠️ Wrong Credentials!")
-            return False
-    except Exception as e:
-        print (Fore.RED + f"[Login Error] {e}")
+        print (C.red(f"[Login Error] {exc}"))
         return False
 
 
@@ -417,110 +669,66 @@ def login():
 # CRUD / Reports
 # ---------------------------
 def add_employee() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Add Employee ===")
+    print (C.cyan("\n=== Add Employee ===", bright=True))
     name = input("Enter Name: ").strip()
-    if not validate_name(name):
-        print (Fore.RED + "Invalid name. Use letters and common punctuation (2-70 chars).")
-        return
     department = input("Enter Department: ").strip()
-    if not validate_department(department):
-        print (Fore.RED + "Invalid department name.")
-        return
     position = input("Enter Position: ").strip()
-    if not validate_position(position):
-        print (Fore.RED + "Invalid position.")
-#---------------------------
-# CRUD and reports
-# ---------------------------
-def add_employee():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Add Employee ===")
-    name = input("Enter Name: ").strip()
-    if not validate_name(name):
-        print (Fore.RED + "Invalid name. Use letters and common punctuation (2-70 chars).")
-        return
-    department = input("Enter Department: ").strip()
-    if not validate_department(department):
-        print (Fore.RED + "Invalid department name.")
-        return
-    position = input("Enter Position: ").strip()
-    if not validate_position(position):
-        print (Fore.RED + "Invalid position.")
+    ok, error = validate_employee_fields(name, department, position)
+    if not ok:
+        print (C.red(error))
         return
     salary_raw = input("Enter Salary (integer): ").strip()
     ok, salary = parse_int(salary_raw)
     if not ok:
-        print (Fore.RED + "Salary must be a non-negative integer (commas allowed).")
-        print (Fore.RED + "Salary must be a non-negative integer (commas allowed).")
+        print (C.red("Salary must be a non-negative integer (commas allowed)."))
         return
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute("SELECT id FROM Employees WHERE name=? AND department=?;", (name, department))
-            if cur.fetchone():
-                print (Fore.RED + Style.BRIGHT + f"\n⚠️ Employee '{name}' already exists in '{department}'.")
-            else:
-                cur.execute(
-                    "INSERT INTO Employees (name, department, position, salary) VALUES (?, ?, ?, ?);",
-                    (name, department, position, salary),
-                )
-                conn.commit()
-                print (Fore.GREEN + f"\n✅ Employee '{name}' added successfully!")
-            cur.close()
+        # UNIQUE(name, department) makes the insert a no-op (no row returned) for duplicates
+        row = get_connection().execute(
+            "INSERT OR IGNORE INTO Employees (name, department, position, salary) VALUES (?, ?, ?, ?) RETURNING id;",
+            (name, department, position, salary),
+        ).fetchone()
+        if row is None:
+            print (C.red(f"\n⚠️ Employee '{name}' already exists in '{department}'.", bright=True))
+        else:
+            print (C.green(f"\n✅ Employee '{name}' added successfully!"))
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Add Error] {exc}")
+        print (C.red(f"[Add Error] {exc}"))
 
 
 def view_all() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== View All Employees ===")
+    print (C.cyan("\n=== View All Employees ===", bright=True))
+    cur = None
     try:
-        results = execute_query(
-            "SELECT id, name, department, position, salary FROM Employees;", fetch=True
-        )
-        if results:
-            headers = ["ID", "Name", "Department", "Position", "Salary"]
-            print (tabulate(results, headers=headers, tablefmt="grid"))
+        cur = execute_query_iter("SELECT id, name, department, position, salary FROM Employees;")
+        if cur is None:
+            return
+        rows = cur.fetchmany()
+        if not rows:
+            print (C.red("No records found."))
             return
-        print (Fore.RED + "No records found.")
+        headers = ["ID", "Name", "Department", "Position", "Salary"]
+        # print one table per chunk so large tables never sit in memory at once
+        while rows:
+            grid = _fast_grid(rows, headers) if len(rows) > FAST_GRID_THRESHOLD else None
+            print (grid if grid is not None else tabulate(rows, headers=headers, tablefmt="grid"))
+            rows = cur.fetchmany()
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[View Error] {exc}")
+        print (C.red(f"[View Error] {exc}"))
+    finally:
+        if cur is not None:
+            cur.close()
 
 
 def filter_department() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Search Employees By Department ===")
-    dept = input("Enter Department, e.g. 'HR': ").strip()
-    if not validate_department(dept):
-        print (Fore.RED + "Invalid department input.")
-                print (Fore.RED + Style.BRIGHT + f"\n⚠️ Employee '{name}' already exists in '{department}'.")
-            else:
-                cur.execute("INSERT INTO Employees (name, department, position, salary) VALUES (?, ?, ?, ?);", (name, department, position, salary))
-                print (Fore.GREEN + f"\n✅ Employee '{name}' added successfully!")
-                cur.close()
-    except Exception as e:
-        print (Fore.RED + f"[Add Error] {e}")
-
-
-def view_all():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== View All Employees ===")
-    try:
-        results = execute_query("SELECT id, name, department, position, salary FROM Employees;", fetch=True)
-        if results:
-            headers = ["ID", "Name", "Department", "Position", "Salary"]
-            print (tabulate(results, headers=headers, tablefmt="grid"))
-        else:
-            print (Fore.RED + "No records found.")
-    except Exception as e:
-        print (Fore.RED + f"[View Error] {e}")
-
-
-def filter_department():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Search Employees By Department ===")
+    print (C.cyan("\n=== Search Employees By Department ===", bright=True))
     dept = input("Enter Department, e.g. 'HR': ").strip()
     if not validate_department(dept):
-        print (Fore.RED + "Invalid department input.")
+        print (C.red("Invalid department input."))
         return
     try:
         results = execute_query(
-            "SELECT id, name, department, position, salary FROM Employees WHERE department=?;",
+            "SELECT id, name, department, position, salary FROM Employees WHERE department=? ORDER BY id;",
             (dept,),
             fetch=True,
         )
@@ -528,35 +736,26 @@ def filter_department():
             headers = ["ID", "Name", "Department", "Position", "Salary"]
             print (tabulate(results, headers=headers, tablefmt="grid"))
             return
-        print (Fore.RED + "No Employees found in that department!")
+        print (C.red("No Employees found in that department!"))
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Filter Error] {exc}")
+        print (C.red(f"[Filter Error] {exc}"))
 
 
 def count_by_department() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Count Employees Per Department ===")
-            print (tabulate(results, headers=headers, tablefmt="grid"))
-        else:
-            print (Fore.RED + "No Employees found in that department!")
-    except Exception as e:
-        print (Fore.RED + f"[Filter Error] {e}")
-
-
-def count_by_department():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Count Employees Per Department ===")
+    print (C.cyan("\n=== Count Employees Per Department ===", bright=True))
     try:
         results = execute_query("SELECT department, COUNT(*) FROM Employees GROUP BY department;", fetch=True)
         if results:
             headers = ["Department", "Employee Count"]
             print (tabulate(results, headers=headers, tablefmt="grid"))
             return
-        print (Fore.RED + "No Employees found!")
+        print (C.red("No Employees found!"))
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Count Error] {exc}")
+        print (C.red(f"[Count Error] {exc}"))
 
 
 def average_salary_per_department() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Average Salary Per Department ===")
+    print (C.cyan("\n=== Average Salary Per Department ===", bright=True))
     try:
         results = execute_query(
             "SELECT department, ROUND(AVG(salary), 2) as avg_salary, COUNT(*) FROM Employees GROUP BY department;",
@@ -566,47 +765,21 @@ def average_salary_per_department() -> None:
             headers = ["Department", "Average Salary", "Employee Count"]
             print (tabulate(results, headers=headers, tablefmt="grid"))
             return
-        print (Fore.RED + "No data available.")
+        print (C.red("No data available."))
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Avg Salary Error] {exc}")
+        print (C.red(f"[Avg Salary Error] {exc}"))
 
 
 def filter_salary() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Show Employees With Salary Over X ===")
-    MIN_SALARY = input("Enter Salary (integer): ").strip()
-    ok, min_salary = parse_int(MIN_SALARY)
-    if not ok:
-        print (Fore.RED + "Invalid salary input.")
-            print (tabulate(results, headers=headers, tablefmt="grid"))
-        else:
-            print (Fore.RED + "No Employees found!")
-    except Exception as e:
-        print (Fore.RED + f"[Count Error] {e}")
-
-
-def average_salary_per_department():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Average Salary Per Department ===")
-    try:
-        results = execute_query("SELECT department, ROUND(AVG(salary), 2) as avg_salary, COUNT(*) FROM Employees GROUP BY department;", fetch=True,)
-        if results:
-            headers = ["Department", "Average Salary", "Employee Count"]
-            print(tabulate(results, headers=headers, tablefmt="grid"))
-        else:
-            print (Fore.RED + "No data available.")
-    except Exception as e:
-        print (Fore.RED + f"[Avg Salary Error] {e}")
-
-
-def filter_salary():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Show Employees With Salary Over X ===")
+    print (C.cyan("\n=== Show Employees With Salary Over X ===", bright=True))
     MIN_SALARY = input("Enter Salary (integer): ").strip()
     ok, min_salary = parse_int(MIN_SALARY)
     if not ok:
-        print (Fore.RED + "Invalid salary input.")
+        print (C.red("Invalid salary input."))
         return
     try:
         results = execute_query(
-            "SELECT id, name, department, position, salary FROM Employees WHERE salary >= ?;",
+            "SELECT id, name, department, position, salary FROM Employees WHERE salary >= ? ORDER BY id;",
             (min_salary,),
             fetch=True,
         )
@@ -614,26 +787,15 @@ def filter_salary():
             headers = ["ID", "Name", "Department", "Position", "Salary"]
             print (tabulate(results, headers=headers, tablefmt="grid"))
             return
-        print (Fore.RED + "No Salary Matches!")
+        print (C.red("No Salary Matches!"))
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Filter Salary Error] {exc}")
+        print (C.red(f"[Filter Salary Error] {exc}"))
 
 
 def sort_by() -> None:
-    print(Fore.CYAN + Style.BRIGHT + "\n=== Sort Employees By Name or Salary ===")
-    while True:
-        print (Fore.YELLOW + "\nSort by: 1. Name  2. Salary  3. Back")
-            print (tabulate(results, headers=headers, tablefmt="grid"))
-        else:
-            print (Fore.RED + "No Salary Matches!")
-    except Exception as e:
-        print (Fore.RED + f"[Filter Salary Error] {e}")
-
-
-def sort_by():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Sort Employees By Name or Salary ===")
+    print (C.cyan("\n=== Sort Employees By Name or Salary ===", bright=True))
     while True:
-        print (Fore.YELLOW + "\nSort by: 1. Name  2. Salary  3. Back") 
+        print (C.yellow("\nSort by: 1. Name  2. Salary  3. Back"))
         choice = input("Enter choice: ").strip()
         if choice == "1":
             sql = "SELECT id, name, department, position, salary FROM Employees ORDER BY name ASC;"
@@ -642,9 +804,7 @@ def sort_by():
         elif choice == "3":
             return
         else:
-            print (Fore.RED + "Invalid choice.")
-            continue
-            print (Fore.RED + "Invalid choice.")
+            print (C.red("Invalid choice."))
             continue
         try:
             results = execute_query(sql, fetch=True)
@@ -652,25 +812,16 @@ def sort_by():
                 headers = ["ID", "Name", "Department", "Position", "Salary"]
                 print (tabulate(results, headers=headers, tablefmt="grid"))
                 return
-            print (Fore.RED + "No records found.")
+            print (C.red("No records found."))
         except Exception as exc:  # pragma: no cover
-            print (Fore.RED + f"[Sort Error] {exc}")
+            print (C.red(f"[Sort Error] {exc}"))
 
 
 def update_employee() -> None:
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Update Employee ===")
-        print (tabulate(results, headers=headers, tablefmt="grid"))
-    else:
-        print (Fore.RED + "No records found.")
-    except Exception as e:
-        print (Fore.RED + f"[Sort Error] {e}")
-
-
-def update_employee():
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Update Employee ===")
+    print (C.cyan("\n=== Update Employee ===", bright=True))
     emp_id_raw = input("Enter Employee ID to update: ").strip()
     if not emp_id_raw.isdigit():
-        print(Fore.RED + "Invalid ID.")
+        print (C.red("Invalid ID."))
         return
     try:
         emp_id = int(emp_id_raw)
@@ -680,12 +831,7 @@ def update_employee():
             fetch=True,
         )
         if not results:
-            print (Fore.RED + "Employee not found.")
-            return
-        row = results[0]
-        print (tabulate([row], headers=["ID", "Name", "Department", "Position", "Salary"], tablefmt="grid"))
-        print ("Leave field empty to keep current value.")
-            print (Fore.RED + "Employee not found.")
+            print (C.red("Employee not found."))
             return
         row = results[0]
         print (tabulate([row], headers=["ID", "Name", "Department", "Position", "Salary"], tablefmt="grid"))
@@ -702,88 +848,168 @@ def update_employee():
         if new_salary_raw:
             ok, salary = parse_int(new_salary_raw)
             if not ok:
-                print (Fore.RED + "Invalid salary.")
-                print (Fore.RED + "Invalid salary.")
+                print (C.red("Invalid salary."))
                 return
         else:
             salary = row[4]
 
-        if not validate_name(name):
-            print (Fore.RED + "Invalid name format.")
-            return
-        if not validate_department(department):
-            print(Fore.RED + "Invalid department.")
-            return
-        if not validate_position(position):
-            print (Fore.RED + "Invalid position.")
         # validate final values
-        if not validate_name(name):
-            print (Fore.RED + "Invalid name format.")
-            return
-        if not validate_department(department):
-            print (Fore.RED + "Invalid department.")
-            return
-        if not validate_position(position):
-            print (Fore.RED + "Invalid position.")
+        ok, error = validate_employee_fields(name, department, position)
+        if not ok:
+            print (C.red(error))
             return
 
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute(
-                "UPDATE Employees SET name=?, department=?, position=?, salary=? WHERE id=?;",
-                (name, department, position, salary, emp_id),
-            )
-            conn.commit()
-            cur.close()
-        print (Fore.GREEN + "✅ Employee updated successfully.")
+        # RETURNING tells us whether the row still existed when we wrote it
+        updated = get_connection().execute(
+            "UPDATE Employees SET name=?, department=?, position=?, salary=? WHERE id=? RETURNING id;",
+            (name, department, position, salary, emp_id),
+        ).fetchone()
+        if updated is None:
+            print (C.red("Employee not found."))
+            return
+        print (C.green("✅ Employee updated successfully."))
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Update Error] {exc}")
+        print (C.red(f"[Update Error] {exc}"))
 
 
 def delete_employee() -> None:
-    print (Fore.RED + "\n=== Delete An Employee From The Database ===")
+    print (C.red("\n=== Delete An Employee From The Database ==="))
     empt_id_raw = input("Enter Employee ID To Delete: ").strip()
     if not empt_id_raw.isdigit():
-        print (Fore.RED + "Invalid ID.")
-            cur.execute("UPDATE Employees SET name=?, department=?, position=?, salary=? WHERE id=?;",(name, department, position, salary, (..., emp_id)))
-            conn.commit()
-            cur.close()
-        print (Fore.GREEN + "✅ Employee updated successfully.")
-    except Exception as e:
-        print (Fore.RED + f"[Update Error] {e}")
-
-
-def delete_employee():
-    print (Fore.RED + "\n=== Delete An Employee From The Database ===")
-    empt_id_raw = input("Enter Employee ID To Delete: ").strip()
-    if not empt_id_raw.isdigit():
-        print (Fore.RED + "Invalid ID.")
+        print (C.red("Invalid ID."))
         return
     empt_id = int(empt_id_raw)
     try:
-        with get_connection() as conn:
-            cur = conn.cursor()
-            cur.execute("DELETE FROM Employees WHERE id=?;", (empt_id,))
-            conn.commit()
-            cur.close()
-        print (Fore.GREEN + "✅ Employee deleted (if existed)!")
+        deleted = get_connection().execute("DELETE FROM Employees WHERE id=? RETURNING id;", (empt_id,)).fetchone()
+        if deleted is None:
+            print (C.red("Employee not found."))
+            return
+        print (C.green("✅ Employee deleted!"))
     except Exception as exc:  # pragma: no cover
-        print(Fore.RED + f"[Delete Error] {exc}")
+        print (C.red(f"[Delete Error] {exc}"))
+
+
+# ---------------------------
+# CSV Export
+# ---------------------------
+# Fixed statement texts so sqlite3's prepared-statement cache is reused across exports
+_EXPORT_ALL_SQL = "SELECT id, name, department, position, salary FROM Employees;"
+_EXPORT_DEPT_SQL = "SELECT id, name, department, position, salary FROM Employees WHERE department=? ORDER BY id;"
+_EXPORT_SAL_SQL = "SELECT id, name, department, position, salary FROM Employees WHERE salary >= ? ORDER BY id;"
+# IDs travel as one JSON array parameter, so the statement text is the same for any count
+_EXPORT_IDS_SQL = "SELECT id, name, department, position, salary FROM Employees WHERE id IN (SELECT value FROM json_each(?));"
+
+EXPORT_HEADERS = ["ID", "Name", "Department", "Position", "Salary"]
+
+
+# Write buffer for CSV exports; large enough to batch thousands of rows per write()
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Characters that force a field to be quoted (csv.QUOTE_MINIMAL, excel dialect)
+_CSV_QUOTE_CHARS = frozenset(',"\r\n')
+_CSV_HEADER_LINE = (",".join(EXPORT_HEADERS) + "\r\n").encode("utf-8")
+# One export row: id, name, department, position, salary
+_CSV_ROW = "%s,%s,%s,%s,%s\r\n"
+
+# Format exports with the csv module instead of the fixed-schema fast path (--csv-strict)
+CSV_STRICT = False
+
+
+def set_csv_strict(strict: bool) -> None:
+    """Choose between the csv module (True) and the fixed-schema writer."""
+    global CSV_STRICT
+    CSV_STRICT = strict
 
 
-def export_employees() -> None:
+def _csv_field(value) -> str:
+    """Format one value exactly as csv.writer's default dialect would."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        if not _CSV_QUOTE_CHARS.isdisjoint(value):
+            return '"' + value.replace('"', '""') + '"'
+        return value
+    return str(value)
+
+
+def _csv_batch(rows: list) -> str:
+    """Format a batch of 5-column export rows as CSV text.
+
+    The whole batch goes through one %-format call. If any field turned out
+    to hold a comma, quote or line break (the separator counts are off), or
+    is NULL (%s would print "None"), the batch is redone field by field.
     """
-    Export employees to CSV. Options:
-      1) All
+    n = len(rows)
+    values = tuple(chain.from_iterable(rows))
+    if None not in values:
+        text = (_CSV_ROW * n) % values
+        if text.count(",") == 4 * n and text.count("\n") == n and text.count("\r") == n and '"' not in text:
+            return text
+    return "".join(",".join(map(_csv_field, row)) + "\r\n" for row in rows)
+
+
+def _stream_export(rows: list, cur: sqlite3.Cursor, sink: BinaryIO) -> int:
+    """Write the CSV header, rows and then the rest of cur to sink; return the row count.
+
+    By default each fetchmany() batch is formatted by _csv_batch, encoded once
+    and handed to the binary sink in one write(); output is identical to
+    csv.writer's. With CSV_STRICT the csv module does the formatting.
+    Either way memory use stays flat however large the export is.
     """
-        print (Fore.GREEN + "✅ Employee deleted (if existed)!")
-    except Exception as e:
-        print (Fore.RED + f"[Delete Error] {e}")
+    total = 0
+    if CSV_STRICT:
+        # csv.writer fills a StringIO per batch; no text wrapper is left holding the sink
+        text = io.StringIO(newline="")
+        writer = csv.writer(text)
+        writer.writerow(EXPORT_HEADERS)
+        while rows:
+            writer.writerows(rows)
+            total += len(rows)
+            sink.write(text.getvalue().encode("utf-8"))
+            text.seek(0)
+            text.truncate()
+            rows = cur.fetchmany()
+        sink.write(text.getvalue().encode("utf-8"))  # the header alone if there were no rows
+        return total
+    sink.write(_CSV_HEADER_LINE)
+    while rows:
+        sink.write(_csv_batch(rows).encode("utf-8"))
+        total += len(rows)
+        rows = cur.fetchmany()
+    return total
+
+
+def _write_csv(path: Path, rows: list, cur: sqlite3.Cursor) -> int:
+    """Export rows and the rest of cur to the file at path; return the row count."""
+    # binary open with buffering=N gives an io.BufferedWriter of that size
+    with path.open("wb", buffering=EXPORT_BUFFER_SIZE) as f:
+        return _stream_export(rows, cur, f)
+
+
+def _write_csv_stream(rows: list, cur: sqlite3.Cursor, stream) -> Optional[int]:
+    """Export rows and the rest of cur to a text stream such as sys.stdout.
+
+    Returns the row count, or None if the reader closed the pipe early
+    (e.g. `--export - | head`).
+    """
+    stream.flush()
+    out = io.BufferedWriter(stream.buffer, buffer_size=EXPORT_BUFFER_SIZE)
+    try:
+        try:
+            total = _stream_export(rows, cur, out)
+            out.flush()
+        except BrokenPipeError:
+            # point the stream's fd at devnull so the remaining flushes
+            # (detach below, interpreter shutdown) succeed silently
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, stream.fileno())
+            os.close(devnull)
+            return None
+        return total
+    finally:
+        out.detach()  # the stream stays usable
 
 
-# ---------------------------
-# CSV Export
-# ---------------------------
 def export_employees():
     """
     Export employees to CSV. Supports:
@@ -791,158 +1017,142 @@ def export_employees():
       2) By department
       3) Salary >= X
       4) Specific IDs (comma-separated)
-b   """
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Export Employees To CSV ===")
-    print (Fore.YELLOW + "Choose export type:\n 1) All\n 2) By department\n 3) Salary >= X\n 4) Specific IDs (comma-separated)\n 5) Back")
-    print (Fore.CYAN + Style.BRIGHT + "\n=== Export Employees To CSV ===")
-    print (Fore.YELLOW + "Choose export type:\n 1) All\n 2) By department\n 3) Salary >= X\n 4) Specific IDs (comma-separated)\n 5) Back")
+    """
+    _say(C.cyan("\n=== Export Employees To CSV ===", bright=True))
+    _say(C.yellow("Choose export type:\n 1) All\n 2) By department\n 3) Salary >= X\n 4) Specific IDs (comma-separated)\n 5) Back"))
 
     choice = input("Enter choice: ").strip()
     if choice == "5":
         return
 
-    sql = "SELECT id, name, department, position, salary FROM Employees"
     params = ()
 
     if choice == "1":
-        sql_final = sql + ";"
+        sql_final = _EXPORT_ALL_SQL
     elif choice == "2":
         dept = input("Enter department: ").strip()
         if not validate_department(dept):
-            print(Fore.RED + "Invalid department.")
-            print (Fore.RED + "Invalid department.")
+            _say(C.red("Invalid department."))
             return
-        sql_final = sql + " WHERE department=?;"
+        sql_final = _EXPORT_DEPT_SQL
         params = (dept,)
     elif choice == "3":
         min_salary_raw = input("Enter minimum salary: ").strip()
         ok, min_salary = parse_int(min_salary_raw)
         if not ok:
-            print(Fore.RED + "Invalid salary.")
-            print (Fore.RED + "Invalid salary.")
+            _say(C.red("Invalid salary."))
             return
-        sql_final = sql + " WHERE salary >= ?;"
+        sql_final = _EXPORT_SAL_SQL
         params = (min_salary,)
     elif choice == "4":
         ids_raw = input("Enter IDs (e.g. 1,3,5): ").strip()
         if not ids_raw:
-            print(Fore.RED + "No IDs provided.")
-            return
-        ids_clean = [x.strip() for x in ids_raw.split(",") if x.strip().isdigit()]
-        if not ids_clean:
-            print(Fore.RED + "Invalid IDs.")
-            print (Fore.RED + "No IDs provided.")
+            _say(C.red("No IDs provided."))
             return
-        ids_clean = [x.strip() for x in ids_raw.split(",") if x.strip().isdigit()]
+        # strip each piece once, then keep only ASCII-digit ones (int() rejects e.g. "²")
+        ids_clean = [x for x in map(str.strip, ids_raw.split(",")) if x.isascii() and x.isdigit()]
         if not ids_clean:
-            print (Fore.RED + "Invalid IDs.")
+            _say(C.red("Invalid IDs."))
             return
-        placeholders = ",".join("?" for _ in ids_clean)
-        sql_final = f"{sql} WHERE id IN ({placeholders});"
-        params = tuple(int(x) for x in ids_clean)
+        sql_final = _EXPORT_IDS_SQL
+        params = (json.dumps(list(map(int, ids_clean))),)
     else:
-        print(Fore.RED + "Invalid choice.")
-        print (Fore.RED + "Invalid choice.")
+        _say(C.red("Invalid choice."))
         return
 
-    try:
-        results = execute_query(sql_final, params, fetch=True)
-        if not results:
-            print(Fore.RED + "No records found — nothing to export.")
-            print (Fore.RED + "No records found — nothing to export.")
-            return
+    # one timestamp per export, taken when the export starts
+    default_name = f"employees_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
 
-        default_name = f"employees_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+    cur = None
+    try:
+        # prompt first, so no read statement stays open while the user types
         filename = input(f"Enter filename (default {default_name}): ").strip() or default_name
         path = Path(filename)
 
         if path.exists():
             overwrite = input("File exists. Overwrite? (y/N): ").strip().lower()
             if overwrite != "y":
-                print(Fore.YELLOW + "Export cancelled.")
-                return
-
-        headers = ["ID", "Name", "Department", "Position", "Salary"]
-                print (Fore.YELLOW + "Export cancelled.")
+                _say(C.yellow("Export cancelled."))
                 return
 
-        # WRITE CSV
-        headers = ["ID", "Name", "Department", "Position", "Salary"]
-        with path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(headers)
-            for row in results:
-                writer.writerow(row)
-
-        print (Fore.GREEN + f"✅ Exported {len(results)} rows to '{path.resolve()}'.")
+        # the streaming SELECT only runs for the duration of the write
+        cur = execute_query_iter(sql_final, params)
+        if cur is None:
+            return  # execute_query_iter already reported the DB error
+        rows = cur.fetchmany()
+        if not rows:
+            # nothing is written, so an existing file is left untouched
+            _say(C.red("No records found — nothing to export."))
+            return
+        total = _write_csv(path, rows, cur)
+        _say(C.green(f"✅ Exported {total} rows to '{path.absolute()}'."))
 
     except Exception as exc:  # pragma: no cover
-        print (Fore.RED + f"[Export Error] {exc}")
-        print (Fore.GREEN + f"✅ Exported {len(results)} rows to '{path.resolve()}'.")
-
-    except Exception as e:
-        print (Fore.RED + f"[Export Error] {e}")
+        _say(C.red(f"[Export Error] {exc}"))
+    finally:
+        if cur is not None:
+            cur.close()
 
 
 # ---------------------------
 # CLI menu
 # ---------------------------
+# Coloured menu text, built once on first use (needs colorama loaded) and reused
+_MENU_TEXT: Optional[str] = None
+
+
+def _menu_text() -> str:
+    """Return the menu as one pre-coloured string, one line per option."""
+    global _MENU_TEXT
+    if _MENU_TEXT is None:
+        lines = [
+            C.cyan("\n=== EMPLOYEE MANAGEMENT SYSTEM ===", bright=True),
+            C.yellow("1. Add New Employee"),
+            C.yellow("2. View All Employees"),
+            C.yellow("3. Search Employees by Department"),
+            C.yellow("4. Count Employees Per Department"),
+            C.yellow("5. Show Employees With Salary Above"),
+            C.yellow("6. Sort Employees By Name And Salary"),
+            C.yellow("7. Update Employee"),
+            C.yellow("8. Delete An Employee Record"),
+            C.yellow("9. Average Salary Per Department"),
+            C.yellow("10. Export Employees to CSV"),
+            C.red("11. Exit"),
+        ]
+        # reset after each line, as autoreset did for the separate prints
+        _MENU_TEXT = (_lazy_color().Style.RESET_ALL + "\n").join(lines)
+    return _MENU_TEXT
+
+
+# Menu choice -> handler ("11" exits and is handled in menu())
+_ACTIONS: Dict[str, Callable[[], None]] = {
+    "1": add_employee,
+    "2": view_all,
+    "3": filter_department,
+    "4": count_by_department,
+    "5": filter_salary,
+    "6": sort_by,
+    "7": update_employee,
+    "8": delete_employee,
+    "9": average_salary_per_department,
+    "10": export_employees,
+}
+
+
 def menu() -> None:
     while True:
-        print (Fore.CYAN + Style.BRIGHT + "\n=== EMPLOYEE MANAGEMENT SYSTEM ===")
-        print (Fore.YELLOW + "1. Add New Employee")
-        print (Fore.YELLOW + "2. View All Employees")
-        print (Fore.YELLOW + "3. Search Employees by Department")
-        print (Fore.YELLOW + "4. Count Employees Per Department")
-        print (Fore.YELLOW + "5. Show Employees With Salary Above")
-        print (Fore.YELLOW + "6. Sort Employees By Name And Salary")
-        print (Fore.YELLOW + "7. Update Employee")
-        print (Fore.YELLOW + "8. Delete An Employee Record")
-        print (Fore.YELLOW + "9. Average Salary Per Department")
-        print (Fore.YELLOW + "10. Export Employees to CSV")
-        print (Fore.RED + "11. Exit")
-def menu():
-    while True:
-        print (Fore.CYAN + Style.BRIGHT + "\n=== EMPLOYEE MANAGEMENT SYSTEM ===")
-        print (Fore.YELLOW + "1. Add New Employee")
-        print (Fore.YELLOW + "2. View All Employees")
-        print (Fore.YELLOW + "3. Search Employees by Department")
-        print (Fore.YELLOW + "4. Count Employees Per Department")
-        print (Fore.YELLOW + "5. Show Employees With Salary Above")
-        print (Fore.YELLOW + "6. Sort Employees By Name And Salary")
-        print (Fore.YELLOW + "7. Update Employee")
-        print (Fore.YELLOW + "8. Delete An Employee Record")
-        print (Fore.YELLOW + "9. Average Salary Per Department")
-        print (Fore.YELLOW + "10. Export Employees to CSV")
-        print (Fore.RED + "11. Exit")
-
-        choice = input(Fore.MAGENTA + "Enter Choice: ").strip()
+        print (_menu_text())
 
-        if choice == "1":
-            add_employee()
-        elif choice == "2":
-            view_all()
-        elif choice == "3":
-            filter_department()
-        elif choice == "4":
-            count_by_department()
-        elif choice == "5":
-            filter_salary()
-        elif choice == "6":
-            sort_by()
-        elif choice == "7":
-            update_employee()
-        elif choice == "8":
-            delete_employee()
-        elif choice == "9":
-            average_salary_per_department()
-        elif choice == "10":
-            export_employees()
-        elif choice == "11":
-            print(Fore.LIGHTBLUE_EX + "Exiting... Goodbye Admin!")
+        choice = input(C.magenta("Enter Choice: ")).strip()
+
+        if choice == "11":
+            print (C.lightblue("Exiting... Goodbye Admin!"))
             break
+        action = _ACTIONS.get(choice)
+        if action is None:
+            print (C.red("\n⚠️ Invalid Choice!"))
         else:
-            print(Fore.RED + "\n⚠️ Invalid Choice!")
+            action()
 
 
 # ---------------------------
@@ -952,88 +1162,69 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
     parser = argparse.ArgumentParser(description="EmployeeFlow — Secure Employee Management (CLI)")
     parser.add_argument("--db", help="Path to DB file (overrides default)", default=None)
     parser.add_argument("--no-seed", action="store_true", help="Do not seed example data")
-    parser.add_argument("--export", nargs="?", const="auto_export.csv", help="Run export and exit (optional filename)")
+    parser.add_argument("--export", nargs="?", const="auto_export.csv", help="Run export and exit (optional filename, - for stdout)")
+    parser.add_argument("--csv-strict", action="store_true", help="Format CSV exports with Python's csv module")
     args = parser.parse_args(argv)
 
     if args.db:
         set_db_file(args.db)
+    if args.csv_strict:
+        set_csv_strict(True)
+
+    if args.export == "-":
+        # "--export -": the CSV goes to stdout, so status messages go to stderr
+        stdout = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            init_db(seed=not args.no_seed)
+            cur = execute_query_iter(_EXPORT_ALL_SQL)
+            if cur is None:
+                return
+            with contextlib.closing(cur):
+                rows = cur.fetchmany()
+                if rows:
+                    total = _write_csv_stream(rows, cur, stdout)
+                    # None: the reader stopped early, which is not an error for a pipe
+                    if total is not None:
+                        _say(C.green(f"✅ Exported {total} rows to stdout."))
+                else:
+                    _say(C.red("No rows to export."))
+        return
 
-    init_db()
-    if not args.no_seed:
-        seed_default_data()
-    remove_duplicates()
+    init_db(seed=not args.no_seed)
 
     if args.export:
         # run export non-interactively (exports all rows)
-        results = execute_query("SELECT id, name, department, position, salary FROM Employees;", fetch=True)
-        if results:
-            filename = args.export or f"employees_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            with Path(filename).open("w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow(["ID", "Name", "Department", "Position", "Salary"])
-                for row in results:
-                    writer.writerow(row)
-            print (Fore.GREEN + f"✅ Exported {len(results)} rows to '{Path(filename).resolve()}'.")
-        else:
-            print (Fore.RED + "No rows to export.")
+        cur = execute_query_iter(_EXPORT_ALL_SQL)
+        if cur is None:
+            return
+        with contextlib.closing(cur):
+            rows = cur.fetchmany()
+            if rows:
+                # a bare --export gets argparse's const, so args.export is always a filename here
+                path = Path(args.export)
+                total = _write_csv(path, rows, cur)
+                _say(C.green(f"✅ Exported {total} rows to '{path.absolute()}'."))
+            else:
+                _say(C.red("No rows to export."))
         return
 
     if not admin_exists():
-        print (Fore.YELLOW + "No admin account found. Please set one now.")
+        print (C.yellow("No admin account found. Please set one now."))
         set_admin_password_interactive()
 
     if not login():
-        print (Fore.RED + "Exiting due to failed login.")
-            print (Fore.LIGHTBLUE_EX + "Exiting... Goodbye Admin!")
-            break
-        else:
-            print (Fore.RED + "\n⚠️ Invalid Choice!")
-
-
-# ---------------------------
-# Main
-# ---------------------------
-def main(argv=None):
-    parser = argparse.ArgumentParser(description="Employee HR Management (CLI)")
-    parser.add_argument("--db", help="Path to DB file (overrides default)", default=None)
-    args = parser.parse_args(argv)
-#always initialize db
-    init_db()
-    seed_default_data()
-    remove_duplicates()
-#And then override if --db provided
-    if args.db:
-        set_db_file(args.db)
-        init_db()
-        seed_default_data()
-        remove_duplicates()
-
-    if not admin_exists():
-        print (Fore.YELLOW + "No admin account found. Please set one now.")
-        set_admin_password_interactive()
-        # try login
-    if not login():
-        print (Fore.RED + "Exiting due to failed login.")
+        print (C.red("Exiting due to failed login."))
         sys.exit(1)
 
     menu()
 
 
 if __name__ == "__main__":
+    warn_slow_crypto_backend()
     try:
         main()
     except KeyboardInterrupt:
-        print ("\n" + Fore.YELLOW + "Interrupted by user. Exiting.")
-        try:
-            conn = get_connection()
-            conn.close()
-        except Exception:
-            pass
+        print ("\n" + C.yellow("Interrupted by user. Exiting."))
+        close_connection()
         print ("\nCreated by Kali Noosi")
-        print ("\n" + Fore.YELLOW + "Interrupted by user. Exiting.")
-        try:
-            get_connection().close()
-            print ('\n"Created by Kali Noosi"')
-        except Exception:
-            pass
         sys.exit(0)
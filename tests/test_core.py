@@ -1,5 +1,75 @@
 import subprocess
 import os
+import csv
+import io
+import sqlite3
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import employee_system_secure_app as app
 
 def test_python_starts():
     assert subprocess.call(["python", "--version"]) == 0
+
+def test_app_compiles():
+    path = os.path.join(os.path.dirname(__file__), os.pardir, "employee_system_secure_app.py")
+    assert subprocess.call(["python", "-m", "py_compile", path]) == 0
+
+
+def _export_bytes(strict, rows):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE t (id, name, department, position, salary)")
+    conn.executemany("INSERT INTO t VALUES (?, ?, ?, ?, ?)", rows)
+    cur = conn.execute("SELECT * FROM t")
+    cur.arraysize = 3
+    sink = io.BytesIO()
+    app.set_csv_strict(strict)
+    try:
+        total = app._stream_export(cur.fetchmany(), cur, sink)
+    finally:
+        app.set_csv_strict(False)
+    expected = io.StringIO(newline="")
+    writer = csv.writer(expected)
+    writer.writerow(app.EXPORT_HEADERS)
+    writer.writerows(rows)
+    return total, sink.getvalue(), expected.getvalue().encode("utf-8")
+
+
+def test_csv_export_matches_csv_writer():
+    rows = [
+        (1, "Plain Name", "IT", "Developer", 50000),
+        (2, "Smith, John", "HR", 'Lead "A"', 40000),
+        (3, "Ünïcode", "Line\nBreak", "Carriage\rReturn", 12.5),
+        (4, "Null Pos", "IT", None, 0),
+        (5, "Tail", "Ops", "Mgr", -1),
+        (6, "Clean", "Ops", "Mgr", 7),
+        (7, "Clean", "Ops", "Mgr", 8),
+    ]
+    for strict in (False, True):
+        total, got, expected = _export_bytes(strict, rows)
+        assert total == len(rows)
+        assert got == expected
+
+
+def test_stdout_export_survives_early_closed_pipe(tmp_path):
+    db = str(tmp_path / "big.db")
+    app.set_db_file(db)
+    try:
+        app.init_db()
+        # several MiB of CSV, so the writer is still going when the reader leaves
+        app.bulk_insert_employees((f"Name {i}", "Dept", "Pos", i) for i in range(100000))
+    finally:
+        app.close_connection()
+        app.set_db_file("Employees.db")
+    script = os.path.join(os.path.dirname(__file__), os.pardir, "employee_system_secure_app.py")
+    for extra in ([], ["--csv-strict"]):
+        proc = subprocess.Popen(
+            [sys.executable, script, "--db", db, "--no-seed", "--export", "-", *extra],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        assert proc.stdout.readline() == b"ID,Name,Department,Position,Salary\r\n"
+        proc.stdout.close()
+        _, err = proc.communicate(timeout=60)
+        assert proc.returncode == 0
+        assert b"Traceback" not in err